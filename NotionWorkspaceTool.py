@@ -1,13 +1,29 @@
 import json
-import os
 from typing import Literal, Optional
 
 import requests
 from agents import RunContextWrapper
 from agents.tool import function_tool
-from dotenv import load_dotenv
 
-load_dotenv()
+from notion_api import (
+    LIST_DB_FILTER,
+    create_pages_bulk,
+    extract_db_title,
+    extract_title,
+    fetch_all_pages,
+    fetch_all_pages_many,
+    format_rows,
+    get_session,
+    get_write_session,
+    invalidate_page_reads,
+    summarize,
+)
+
+
+# Operations whose requests Notion may apply more than once if re-sent; they use the 429-only write session.
+_NON_IDEMPOTENT_OPS = frozenset({"append_block", "create_page", "create_pages_bulk"})
+# Operations that change pages; they drop NotionDatabaseTool's cached page reads, which share notion_api's cache.
+_MUTATING_OPS = frozenset({"update_page", "append_block", "create_page", "create_pages_bulk"})
 
 
 @function_tool(name_override="notion_workspace", strict_mode=True)
@@ -21,184 +37,206 @@ def notion_workspace(
         "list_databases",
         "list_database_pages",
         "create_page",
+        "create_pages_bulk",
     ],
     target_id: str,
     properties_json: Optional[str] = None,
+    batch_payload_json: Optional[str] = None,
     rich_text: Optional[str] = None,
     page_size: int = 25,
     max_pages: int = 3,
+    result_limit: Optional[int] = None,
 ) -> str:
     """
-    Perform Notion workspace actions via the REST API: list databases, query a database, list pages in a database, fetch a page, update page properties, append a text block, or create a new page/record in a database.
+    Perform Notion workspace actions via the REST API: list databases, query a database, list pages in one or more databases (comma-separated target_id, fetched concurrently), fetch a page, update page properties, append a text block, or create new pages/records in a database (one, or many concurrently via batch_payload_json, a JSON list of {properties, rich_text?} objects). result_limit caps the rows returned by query/list operations (query_database defaults to 10) and stops pagination early.
     """
 
-    api_key = (
-        os.getenv("NOTION_API_KEY")
-        or os.getenv("NOTION_TOKEN")
-        or os.getenv("NOTION_MCP_OAUTH_TOKEN")
-        or os.getenv("NOTION_MCP_TOKEN")
+    handler = _OPS.get(operation)
+    if handler is None:
+        raise ValueError(f"Unsupported operation: {operation}")
+    if result_limit is not None and result_limit < 1:
+        raise ValueError("result_limit must be at least 1.")
+    session = get_write_session() if operation in _NON_IDEMPOTENT_OPS else get_session()
+    result = handler(
+        session,
+        target_id,
+        properties_json=properties_json,
+        batch_payload_json=batch_payload_json,
+        rich_text=rich_text,
+        page_size=page_size,
+        max_pages=max_pages,
+        result_limit=result_limit,
     )
-    if not api_key:
-        raise ValueError("Missing NOTION_API_KEY (or NOTION_TOKEN / NOTION_MCP_OAUTH_TOKEN / NOTION_MCP_TOKEN).")
+    if operation in _MUTATING_OPS:
+        invalidate_page_reads()
+    return result
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Notion-Version": os.getenv("NOTION_API_VERSION", "2022-06-28"),
-        "Content-Type": "application/json",
-    }
 
-    if operation == "list_databases":
-        payload = {"page_size": page_size, "filter": {"value": "database", "property": "object"}}
-        databases = []
-        cursor = None
-        for _ in range(max_pages):
-            if cursor:
-                payload["start_cursor"] = cursor
-            elif "start_cursor" in payload:
-                payload.pop("start_cursor")
-            res = requests.post("https://api.notion.com/v1/search", headers=headers, json=payload, timeout=30)
-            res.raise_for_status()
-            data = res.json()
-            databases.extend(data.get("results", []))
-            cursor = data.get("next_cursor")
-            if not cursor:
-                break
-        lines = []
-        for idx, db in enumerate(databases, 1):
-            lines.append(f"{idx}. { _extract_db_title(db) } ({db.get('id')})")
-        return "Databases:\n" + ("\n".join(lines) if lines else "(none found)")
-
-    if operation == "query_database":
-        payload = {"page_size": page_size}
-        res = requests.post(
-            f"https://api.notion.com/v1/databases/{target_id}/query",
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
-        res.raise_for_status()
-        rows = res.json().get("results", [])
-        titles = [_extract_title(r) for r in rows[:10]]
-        body = "\n".join(f"- {t} ({r.get('id')})" for t, r in zip(titles, rows[:10]))
-        return f"Queried database {target_id}: {len(rows)} results (showing up to 10):\n{body}"
-
-    if operation == "list_database_pages":
-        payload = {"page_size": page_size}
-        pages = []
-        cursor = None
-        for _ in range(max_pages):
-            if cursor:
-                payload["start_cursor"] = cursor
-            elif "start_cursor" in payload:
-                payload.pop("start_cursor")
-            res = requests.post(
-                f"https://api.notion.com/v1/databases/{target_id}/query",
-                headers=headers,
-                json=payload,
-                timeout=30,
-            )
-            res.raise_for_status()
-            data = res.json()
-            pages.extend(data.get("results", []))
-            cursor = data.get("next_cursor")
-            if not cursor:
-                break
-        lines = []
-        for idx, pg in enumerate(pages, 1):
-            lines.append(f"{idx}. {_extract_title(pg)} ({pg.get('id')})")
-        return f"Database {target_id} pages (paginated up to {max_pages} pages x {page_size}):\n" + (
-            "\n".join(lines) if lines else "(none found)"
-        )
+def _op_list_databases(
+    session: requests.Session,
+    target_id: str,
+    *,
+    page_size: int,
+    max_pages: int,
+    result_limit: Optional[int],
+    **_,
+) -> str:
+    payload = {"page_size": page_size, "filter": LIST_DB_FILTER}
+    databases = fetch_all_pages(
+        session,
+        "https://api.notion.com/v1/search",
+        payload,
+        max_pages,
+        lambda db: (extract_db_title(db), db["id"]),
+        result_limit,
+    )
+    return "Databases:\n" + format_rows(databases)
 
-    if operation == "fetch_page":
-        res = requests.get(
-            f"https://api.notion.com/v1/pages/{target_id}",
-            headers=headers,
-            timeout=30,
-        )
-        res.raise_for_status()
-        data = res.json()
-        title = _extract_title(data)
-        return f"Fetched page {target_id} titled '{title}'."
-
-    if operation == "update_page":
-        if not properties_json:
-            raise ValueError("properties_json is required for update_page.")
-        properties = json.loads(properties_json)
-        res = requests.patch(
-            f"https://api.notion.com/v1/pages/{target_id}",
-            headers=headers,
-            json={"properties": properties},
-            timeout=30,
-        )
-        res.raise_for_status()
-        return f"Updated page {target_id} properties."
-
-    if operation == "append_block":
-        if not rich_text:
-            raise ValueError("rich_text is required for append_block.")
-        payload = {
-            "children": [
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {"rich_text": [{"type": "text", "text": {"content": rich_text}}]},
-                }
-            ]
-        }
-        res = requests.patch(
-            f"https://api.notion.com/v1/blocks/{target_id}/children",
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
-        res.raise_for_status()
-        return f"Appended paragraph block under {target_id}."
-
-    if operation == "create_page":
-        if not properties_json:
-            raise ValueError("properties_json is required for create_page.")
-        properties = json.loads(properties_json)
-        payload: dict = {"parent": {"database_id": target_id}, "properties": properties}
-        if rich_text:
-            payload["children"] = [
-                {
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {"rich_text": [{"type": "text", "text": {"content": rich_text}}]},
-                }
-            ]
-        res = requests.post(
-            "https://api.notion.com/v1/pages",
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
-        res.raise_for_status()
-        created = res.json()
-        return f"Created page in database {target_id} with id {created.get('id')}."
 
-    raise ValueError(f"Unsupported operation: {operation}")
+def _op_query_database(
+    session: requests.Session,
+    target_id: str,
+    *,
+    page_size: int,
+    result_limit: Optional[int],
+    **_,
+) -> str:
+    limit = result_limit if result_limit is not None else 10
+    payload = {"page_size": min(page_size, limit)}
+    res = session.post(
+        f"https://api.notion.com/v1/databases/{target_id}/query",
+        json=payload,
+        timeout=30,
+    )
+    res.raise_for_status()
+    data = res.json()
+    rows = data.get("results", [])[:limit]
+    more = ", more available" if data.get("has_more") else ""
+    body = "\n".join(f"- {title} ({row_id})" for title, row_id in map(summarize, rows))
+    return f"Queried database {target_id}: {len(rows)} results (showing up to {limit}{more}):\n{body}"
+
 
+def _op_list_database_pages(
+    session: requests.Session,
+    target_id: str,
+    *,
+    page_size: int,
+    max_pages: int,
+    result_limit: Optional[int],
+    **_,
+) -> str:
+    db_ids = [db_id.strip() for db_id in target_id.split(",") if db_id.strip()]
+    if not db_ids:
+        raise ValueError("target_id is required for list_database_pages.")
+    urls = [f"https://api.notion.com/v1/databases/{db_id}/query" for db_id in db_ids]
+    page_lists = fetch_all_pages_many(session, urls, {"page_size": page_size}, max_pages, summarize, result_limit)
+    return "\n\n".join(
+        f"Database {db_id} pages (paginated up to {max_pages} pages x {page_size}):\n" + format_rows(pages)
+        for db_id, pages in zip(db_ids, page_lists)
+    )
 
-def _extract_title(page_data: dict) -> str:
-    props = page_data.get("properties", {})
-    for prop in props.values():
-        if isinstance(prop, dict) and prop.get("type") == "title":
-            title_items = prop.get("title", [])
-            if title_items:
-                return title_items[0].get("plain_text", "").strip() or "(untitled)"
-    return "(untitled)"
 
+def _op_fetch_page(session: requests.Session, target_id: str, **_) -> str:
+    res = session.get(
+        f"https://api.notion.com/v1/pages/{target_id}",
+        timeout=30,
+    )
+    res.raise_for_status()
+    data = res.json()
+    title = extract_title(data)
+    return f"Fetched page {target_id} titled '{title}'."
+
+
+def _op_update_page(session: requests.Session, target_id: str, *, properties_json: Optional[str], **_) -> str:
+    if not properties_json:
+        raise ValueError("properties_json is required for update_page.")
+    properties = json.loads(properties_json)
+    res = session.patch(
+        f"https://api.notion.com/v1/pages/{target_id}",
+        json={"properties": properties},
+        timeout=30,
+    )
+    res.raise_for_status()
+    return f"Updated page {target_id} properties."
+
+
+def _op_append_block(session: requests.Session, target_id: str, *, rich_text: Optional[str], **_) -> str:
+    if not rich_text:
+        raise ValueError("rich_text is required for append_block.")
+    payload = {
+        "children": [
+            {
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": {"rich_text": [{"type": "text", "text": {"content": rich_text}}]},
+            }
+        ]
+    }
+    res = session.patch(
+        f"https://api.notion.com/v1/blocks/{target_id}/children",
+        json=payload,
+        timeout=30,
+    )
+    res.raise_for_status()
+    return f"Appended paragraph block under {target_id}."
 
-def _extract_db_title(db_data: dict) -> str:
-    title_items = db_data.get("title", [])
-    if title_items:
-        return title_items[0].get("plain_text", "").strip() or "(untitled)"
-    return "(untitled)"
+
+def _op_create_page(
+    session: requests.Session,
+    target_id: str,
+    *,
+    properties_json: Optional[str],
+    rich_text: Optional[str],
+    **_,
+) -> str:
+    if not properties_json:
+        raise ValueError("properties_json is required for create_page.")
+    properties = json.loads(properties_json)
+    payload: dict = {"parent": {"database_id": target_id}, "properties": properties}
+    if rich_text:
+        payload["children"] = [
+            {
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": {"rich_text": [{"type": "text", "text": {"content": rich_text}}]},
+            }
+        ]
+    res = session.post(
+        "https://api.notion.com/v1/pages",
+        json=payload,
+        timeout=30,
+    )
+    res.raise_for_status()
+    created = res.json()
+    return f"Created page in database {target_id} with id {created.get('id')}."
+
+
+def _op_create_pages_bulk(session: requests.Session, target_id: str, *, batch_payload_json: Optional[str], **_) -> str:
+    if not batch_payload_json:
+        raise ValueError("batch_payload_json is required for create_pages_bulk.")
+    results = create_pages_bulk(session, target_id, json.loads(batch_payload_json))
+    created_count = sum(1 for r in results if "id" in r)
+    return f"Created {created_count}/{len(results)} pages in database {target_id}. Results: {json.dumps(results)}"
+
+
+# Operation name -> handler; every handler takes the session and target_id plus the tool's remaining arguments.
+_OPS = {
+    "list_databases": _op_list_databases,
+    "query_database": _op_query_database,
+    "list_database_pages": _op_list_database_pages,
+    "fetch_page": _op_fetch_page,
+    "update_page": _op_update_page,
+    "append_block": _op_append_block,
+    "create_page": _op_create_page,
+    "create_pages_bulk": _op_create_pages_bulk,
+}
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     # Smoke test (will fail without valid env and IDs)
     try:
         print(
@@ -1,12 +1,13 @@
 from dotenv import load_dotenv
+
+# Load .env once for the whole process, before the agents (and their tools) are imported; tool modules don't reload it.
+load_dotenv(override=False)
+
 from agency_swarm import Agency
-from dotenv import load_dotenv
 
 from lead_search_agent import lead_search_agent
 from outreach_agent import outreach_agent
 
-load_dotenv()
-
 # do not remove this method, it is used in the main.py file to deploy the agency (it has to be a method)
 def create_agency(load_threads_callback=None):
     agency = Agency(
@@ -5,7 +5,7 @@ from openai.types.shared import Reasoning
 
 lead_search_agent = Agent(
     name="LeadSearchAgent",
-    description="Find and validate leads via web search, summarize candidates, and hand off approved leads for capture and outreach.",
+    description="Find and validate leads via web search, summarize candidates, bulk-save approved leads to Notion, and hand off for outreach.",
     instructions="./instructions.md",
     files_folder="./files",
     tools_folder="./tools",
@@ -0,0 +1,163 @@
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+from agency_swarm.tools import BaseTool
+from pydantic import Field
+
+# notion_api lives at the repo root; make it importable when this file is run directly
+# (python <agent>/tools/<Tool>.py puts only the tools folder on sys.path).
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from notion_api import create_pages_bulk, fetch_all_pages, get_session, get_write_session, invalidate_page_reads
+
+
+# Conditions per duplicate-lookup query; larger batches are looked up in several queries.
+_DEDUPE_FILTER_CHUNK = 50
+
+
+def _rich_text_value(items: list) -> str:
+    # Existing rows carry plain_text; lead payloads carry text.content.
+    return "".join(item.get("plain_text") or item.get("text", {}).get("content", "") for item in items).strip()
+
+
+def _lead_identity(properties: dict, title_key: Optional[str], email_key: Optional[str]) -> Optional[tuple]:
+    """Identity of a lead: its email when the database has an email property and the lead has one, else its name."""
+    if email_key and (properties.get(email_key) or {}).get("email"):
+        return "email", properties[email_key]["email"].strip()
+    if title_key:
+        name = _rich_text_value((properties.get(title_key) or {}).get("title") or [])
+        if name:
+            return "name", name
+    return None
+
+
+def _normalize(identity: Optional[tuple]) -> Optional[tuple]:
+    return identity and (identity[0], identity[1].lower())
+
+
+def _identity_filter(identity: tuple, title_key: Optional[str], email_key: Optional[str]) -> dict:
+    kind, value = identity
+    if kind == "email":
+        return {"property": email_key, "email": {"equals": value}}
+    return {"property": title_key, "title": {"equals": value}}
+
+
+class BulkLeadIngestTool(BaseTool):
+    """
+    Write a batch of user-approved leads straight into the confirmed Notion leads database in a single call, instead
+    of handing each lead to OutreachAgent. Property names are checked against the database schema, leads already in
+    the database (matched by email, or by name when there is no email) are skipped, and the remaining pages are
+    created concurrently. Uses the cached context key 'lead_db_id' when database_id is omitted.
+    """
+
+    leads: list[dict] = Field(
+        ...,
+        description=(
+            "Approved leads, one per page: {\"properties\": {...Notion properties...}, \"rich_text\": \"optional notes\"} "
+            "(e.g., {\"properties\": {\"Name\": {\"title\": [{\"text\": {\"content\": \"Alice\"}}]}}})."
+        ),
+    )
+    database_id: Optional[str] = Field(
+        None,
+        description="Confirmed Notion leads database id. If omitted, falls back to context key 'lead_db_id'.",
+    )
+
+    def run(self) -> str:
+        target = self.database_id or self._context.get("lead_db_id")
+        if not target:
+            raise ValueError("database_id is required (or have OutreachAgent confirm and cache lead_db_id) for ingestion.")
+
+        session = get_session()
+        res = session.get(f"https://api.notion.com/v1/databases/{target}", timeout=30)
+        res.raise_for_status()
+        schema = {name: prop["type"] for name, prop in res.json().get("properties", {}).items()}
+        title_key = next((name for name, kind in schema.items() if kind == "title"), None)
+        email_key = next((name for name, kind in schema.items() if kind == "email"), None)
+
+        results: list[Optional[dict]] = [None] * len(self.leads)
+        identities: list[Optional[tuple]] = [None] * len(self.leads)
+        for idx, lead in enumerate(self.leads):
+            unknown = sorted(set(lead.get("properties", {})) - set(schema))
+            if unknown:
+                results[idx] = {"error": f"Unknown properties {unknown}; database properties: {sorted(schema)}"}
+            else:
+                identities[idx] = _lead_identity(lead.get("properties", {}), title_key, email_key)
+
+        existing = self._find_existing(session, target, {i for i in identities if i}, title_key, email_key)
+        seen: dict[tuple, int] = {}
+        to_create: list[int] = []
+        for idx, key in enumerate(map(_normalize, identities)):
+            if results[idx] is not None:
+                continue
+            if key in existing:
+                results[idx] = {"skipped": f"already in database as page {existing[key]}"}
+            elif key in seen:
+                results[idx] = {"skipped": f"duplicate of lead {seen[key] + 1} in this batch"}
+            else:
+                if key:
+                    seen[key] = idx
+                to_create.append(idx)
+
+        if to_create:
+            created = create_pages_bulk(get_write_session(), target, [self.leads[idx] for idx in to_create])
+            for idx, result in zip(to_create, created):
+                results[idx] = result
+            invalidate_page_reads()
+
+        created_count = sum(1 for r in results if "id" in r)
+        skipped_count = sum(1 for r in results if "skipped" in r)
+        return (
+            f"Ingested {created_count}/{len(results)} leads into database {target} "
+            f"({skipped_count} skipped as duplicates). Results: {json.dumps(results)}"
+        )
+
+    @staticmethod
+    def _find_existing(
+        session, database_id: str, identities: set, title_key: Optional[str], email_key: Optional[str]
+    ) -> dict:
+        """Map the normalized identity of each lead that already has a page in the database to that page's id."""
+        if not identities:
+            return {}
+        url = f"https://api.notion.com/v1/databases/{database_id}/query"
+        wanted = {_normalize(identity) for identity in identities}
+        ordered = sorted(identities)
+        existing: dict[tuple, str] = {}
+        for start in range(0, len(ordered), _DEDUPE_FILTER_CHUNK):
+            chunk = ordered[start : start + _DEDUPE_FILTER_CHUNK]
+            payload = {"page_size": 100, "filter": {"or": [_identity_filter(i, title_key, email_key) for i in chunk]}}
+            rows = fetch_all_pages(
+                session,
+                url,
+                payload,
+                max_pages=5,
+                summarize=lambda row: (row.get("properties", {}), row["id"]),
+            )
+            for properties, page_id in rows:
+                # Index each row under both identities so either match kind finds it.
+                for key in (
+                    _normalize(_lead_identity(properties, None, email_key)),
+                    _normalize(_lead_identity(properties, title_key, None)),
+                ):
+                    if key in wanted:
+                        existing.setdefault(key, page_id)
+        return existing
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    # Smoke test (will fail without valid env and IDs)
+    tool = BulkLeadIngestTool(
+        database_id="YOUR_DATABASE_ID",
+        leads=[{"properties": {"Name": {"title": [{"text": {"content": "Test Lead"}}]}}}],
+    )
+    try:
+        print(tool.run())
+    except Exception as exc:  # pragma: no cover - manual run aid
+        print(f"Test failed: {exc}")
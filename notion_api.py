@@ -0,0 +1,257 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Max requests in flight per fan-out (list_database_pages, create_pages_bulk). This caps concurrency, not rate:
+# three concurrent requests can still exceed Notion's average of 3 requests/second, and the resulting 429s are
+# absorbed by the Retry-After-aware backoff in _RETRY / _WRITE_RETRY below.
+MAX_CONCURRENCY = 3
+
+# Short-lived cache of formatted results for read-only operations, so re-inspecting the same database while
+# planning does not pay a Notion round-trip each time. It is process-wide, so every tool that writes pages (in any
+# agent) drops the entries it could make stale via invalidate_page_reads().
+_CACHE_TTL_SECONDS = 60
+_CACHE_MAXSIZE = 256
+_READ_CACHE: dict[tuple, tuple[float, str]] = {}
+# Tool calls run in parallel threads; every read or write of _READ_CACHE holds this lock.
+_READ_CACHE_LOCK = threading.Lock()
+
+# Search filter restricting results to databases; constant across list_databases calls.
+LIST_DB_FILTER = {"value": "database", "property": "object"}
+
+# Title property name keyed by database id (see extract_title).
+_TITLE_KEY_CACHE: dict[str, str] = {}
+
+# Transient failures (notably 429 from rate limiting) are retried with exponential backoff, honouring Retry-After,
+# instead of failing the whole call. raise_on_status=False hands the last response back so raise_for_status()
+# reports the real status once retries are exhausted. Used for reads (search, query, GET) and property updates,
+# which are safe to repeat.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET", "POST", "PATCH"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+class _RateLimitRetry(Retry):
+    # urllib3 also retries 413/503 responses that carry Retry-After; for writes only a 429 is known to be unapplied.
+    RETRY_AFTER_STATUS_CODES = frozenset([429])
+
+
+# Notion has no idempotency key, so page creation and block appends are only re-sent when the request provably did
+# not take effect: a 429 rejection or a failed connect. A 5xx or a read error may follow a write that succeeded.
+_WRITE_RETRY = _RateLimitRetry(
+    total=5,
+    read=0,
+    other=0,
+    backoff_factor=0.5,
+    status_forcelist=[429],
+    allowed_methods=frozenset(["POST", "PATCH"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+_HEADERS: Optional[dict] = None
+_SESSION: Optional[requests.Session] = None
+_WRITE_SESSION: Optional[requests.Session] = None
+
+
+def get_headers() -> dict:
+    """Resolve the Notion credentials once and cache the request headers for the life of the process."""
+    global _HEADERS
+    if _HEADERS is None:
+        api_key = (
+            os.getenv("NOTION_API_KEY")
+            or os.getenv("NOTION_TOKEN")
+            or os.getenv("NOTION_MCP_OAUTH_TOKEN")
+            or os.getenv("NOTION_MCP_TOKEN")
+        )
+        if not api_key:
+            raise ValueError("Missing Notion credentials: set NOTION_API_KEY (or NOTION_TOKEN / NOTION_MCP_OAUTH_TOKEN / NOTION_MCP_TOKEN).")
+        _HEADERS = {
+            "Authorization": f"Bearer {api_key}",
+            "Notion-Version": os.getenv("NOTION_API_VERSION", "2022-06-28"),
+            "Content-Type": "application/json",
+        }
+    return _HEADERS
+
+
+def _new_session(retry: Retry) -> requests.Session:
+    session = requests.Session()
+    # The pool is deliberately larger than MAX_CONCURRENCY: the agents can run several tool calls in parallel,
+    # each with its own fan-out, and all of them share this session's keep-alive connections.
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=retry,
+    )
+    session.mount("https://api.notion.com", adapter)
+    session.headers.update(get_headers())
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the shared Notion session for repeatable requests (pooled, fully retrying), creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _new_session(_RETRY)
+    return _SESSION
+
+
+def get_write_session() -> requests.Session:
+    """Return the shared Notion session for non-idempotent writes (page creation, block appends); retries 429 only."""
+    global _WRITE_SESSION
+    if _WRITE_SESSION is None:
+        _WRITE_SESSION = _new_session(_WRITE_RETRY)
+    return _WRITE_SESSION
+
+
+def cache_get(key: tuple) -> Optional[str]:
+    with _READ_CACHE_LOCK:
+        entry = _READ_CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            _READ_CACHE.pop(key, None)
+            return None
+        return value
+
+
+def cache_set(key: tuple, value: str) -> None:
+    with _READ_CACHE_LOCK:
+        if key not in _READ_CACHE and len(_READ_CACHE) >= _CACHE_MAXSIZE:
+            _READ_CACHE.pop(next(iter(_READ_CACHE)), None)
+        _READ_CACHE[key] = (time.monotonic() + _CACHE_TTL_SECONDS, value)
+
+
+def invalidate_page_reads() -> None:
+    """Drop cached page listings/queries/fetches; the database list itself is unaffected by page writes."""
+    with _READ_CACHE_LOCK:
+        for key in [key for key in _READ_CACHE if key[0] != "list_databases"]:
+            del _READ_CACHE[key]
+
+
+def fetch_all_pages(
+    session: requests.Session,
+    url: str,
+    payload: dict,
+    max_pages: int,
+    summarize: Callable[[dict], tuple],
+    limit: Optional[int] = None,
+) -> list[tuple]:
+    """
+    POST to a paginated Notion endpoint, following next_cursor for up to max_pages requests. Each result is reduced
+    via summarize as its page arrives, so the full row objects are not kept around across pages. When limit is set,
+    page_size is capped to the rows still needed and pagination stops once limit rows are collected.
+    """
+    payload = dict(payload)
+    page_size = payload.get("page_size", 100)
+    results = []
+    for _ in range(max_pages):
+        if limit is not None:
+            payload["page_size"] = min(page_size, limit - len(results))
+        res = session.post(url, json=payload, timeout=30)
+        res.raise_for_status()
+        data = res.json()
+        results.extend(map(summarize, data.get("results", [])))
+        if limit is not None and len(results) >= limit:
+            return results[:limit]
+        cursor = data.get("next_cursor")
+        if not cursor:
+            break
+        payload["start_cursor"] = cursor
+    return results
+
+
+def fetch_all_pages_many(
+    session: requests.Session,
+    urls: list[str],
+    payload: dict,
+    max_pages: int,
+    summarize: Callable[[dict], tuple],
+    limit: Optional[int] = None,
+) -> list[list[tuple]]:
+    """Run fetch_all_pages for several endpoints concurrently (bounded by MAX_CONCURRENCY), preserving order."""
+
+    def fetch(url: str) -> list[tuple]:
+        return fetch_all_pages(session, url, payload, max_pages, summarize, limit)
+
+    if len(urls) <= 1:
+        return [fetch(url) for url in urls]
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(urls))) as pool:
+        return list(pool.map(fetch, urls))
+
+
+def create_page(session: requests.Session, database_id: str, item: dict) -> dict:
+    """Create one page; pass get_write_session() so a failed create is never blindly re-sent."""
+    payload: dict = {"parent": {"database_id": database_id}, "properties": item.get("properties", {})}
+    if item.get("rich_text"):
+        payload["children"] = [
+            {
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": {"rich_text": [{"type": "text", "text": {"content": item["rich_text"]}}]},
+            }
+        ]
+    try:
+        res = session.post("https://api.notion.com/v1/pages", json=payload, timeout=30)
+        res.raise_for_status()
+        return {"id": res.json().get("id")}
+    except requests.RequestException as exc:
+        return {"error": str(exc)}
+
+
+def create_pages_bulk(session: requests.Session, database_id: str, items: list[dict]) -> list[dict]:
+    """Create one page per item concurrently (bounded by MAX_CONCURRENCY); returns {"id"} or {"error"} per item."""
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError("Bulk payload must be a list of {properties, rich_text?} objects.")
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(items))) as pool:
+        return list(pool.map(lambda item: create_page(session, database_id, item), items))
+
+
+def extract_title(page_data: dict) -> str:
+    # Notion always sends "type" on property values and "plain_text" on rich text items, so index them directly.
+    props = page_data.get("properties", {})
+    database_id = page_data.get("parent", {}).get("database_id")
+    key = _TITLE_KEY_CACHE.get(database_id)
+    if key not in props or props[key]["type"] != "title":
+        # Every row in a database shares the same title property, so scan once per database and remember its name;
+        # rescan if the cached name is missing or no longer the title (e.g. the property was renamed or retyped).
+        key = next((name for name, prop in props.items() if prop["type"] == "title"), None)
+        if key is None:
+            return "(untitled)"
+        if database_id:
+            _TITLE_KEY_CACHE[database_id] = key
+    title_items = props[key]["title"]
+    if title_items:
+        return title_items[0]["plain_text"].strip() or "(untitled)"
+    return "(untitled)"
+
+
+def extract_db_title(db_data: dict) -> str:
+    title_items = db_data.get("title", [])
+    if title_items:
+        return title_items[0].get("plain_text", "").strip() or "(untitled)"
+    return "(untitled)"
+
+
+def summarize(row: dict) -> tuple[str, str]:
+    return extract_title(row), row["id"]
+
+
+def format_rows(rows: list[tuple]) -> str:
+    """Render (title, id) rows as a numbered list in a single join, without an intermediate list of lines."""
+    return "\n".join(f"{idx}. {title} ({row_id})" for idx, (title, row_id) in enumerate(rows, 1)) or "(none found)"
@@ -1,19 +1,43 @@
 import json
-import os
+import sys
+from pathlib import Path
 from typing import Literal, Optional
 
-import requests
 from agency_swarm.tools import BaseTool
-from pydantic import Field
-from dotenv import load_dotenv
-
-load_dotenv()
+from pydantic import Field, model_validator
+
+# notion_api lives at the repo root; make it importable when this file is run directly
+# (python <agent>/tools/<Tool>.py puts only the tools folder on sys.path).
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
+
+from notion_api import (
+    LIST_DB_FILTER,
+    cache_get,
+    cache_set,
+    create_pages_bulk,
+    extract_title,
+    fetch_all_pages,
+    fetch_all_pages_many,
+    format_rows,
+    get_session,
+    get_write_session,
+    invalidate_page_reads,
+    summarize,
+)
+
+
+# Read-only operations served from notion_api's read cache; writes drop the entries they could make stale.
+_CACHED_OPERATIONS = frozenset({"list_databases", "list_database_pages", "query_database", "fetch_page"})
+_MUTATING_OPERATIONS = frozenset({"create_page", "create_pages_bulk", "update_page"})
 
 
 class NotionDatabaseTool(BaseTool):
     """
     Perform Notion database operations with a confirmed database id. Supports listing databases, listing/querying pages,
-    fetching a page, and creating/updating pages. Uses a cached context key 'lead_db_id' when target_id is omitted.
+    fetching a page, and creating/updating pages (including bulk creation). Uses a cached context key 'lead_db_id' when
+    target_id is omitted.
     """
 
     operation: Literal[
@@ -22,141 +46,156 @@ class NotionDatabaseTool(BaseTool):
         "query_database",
         "fetch_page",
         "create_page",
+        "create_pages_bulk",
         "update_page",
     ] = Field(..., description="Which Notion operation to perform.")
     target_id: Optional[str] = Field(
         None,
-        description="Database id for list/query/create, or page id for fetch/update. If omitted, falls back to context key 'lead_db_id'.",
+        description=(
+            "Database id for list/query/create, or page id for fetch/update. list_database_pages also accepts a "
+            "comma-separated list of database ids, fetched concurrently. If omitted, falls back to context key 'lead_db_id'."
+        ),
+    )
+    properties: Optional[dict] = Field(
+        None,
+        description="Properties object for create/update operations (e.g., {\"Name\": {\"title\": [{\"text\": {\"content\": \"Alice\"}}]}}).",
     )
-    properties_json: Optional[str] = Field(
+    batch_payload: Optional[list[dict]] = Field(
         None,
-        description="JSON string of properties for create/update operations (e.g., {\"Name\": {\"title\": [{\"text\": {\"content\": \"Alice\"}}]}}).",
+        description=(
+            "List of {\"properties\": {...}, \"rich_text\": \"optional paragraph\"} objects for create_pages_bulk; "
+            "one page is created per item, concurrently."
+        ),
     )
+    # Backward-compatible JSON-string forms of the fields above; parsed into them during validation.
+    properties_json: Optional[str] = Field(None, description="Deprecated: JSON string form of properties.")
+    batch_payload_json: Optional[str] = Field(None, description="Deprecated: JSON string form of batch_payload.")
     page_size: int = Field(10, description="Max items per page for list/query calls.")
     max_pages: int = Field(3, description="Max pages to paginate through for list/query calls.")
+    result_limit: Optional[int] = Field(
+        None,
+        ge=1,
+        description=(
+            "Stop once this many rows are collected (per database). Defaults to 10 for query_database and to no "
+            "limit (max_pages x page_size) for list operations."
+        ),
+    )
 
-    def run(self) -> str:
-        api_key = (
-            os.getenv("NOTION_API_KEY")
-            or os.getenv("NOTION_TOKEN")
-            or os.getenv("NOTION_MCP_OAUTH_TOKEN")
-            or os.getenv("NOTION_MCP_TOKEN")
-        )
-        if not api_key:
-            raise ValueError("Missing Notion credentials: set NOTION_API_KEY (or NOTION_TOKEN / NOTION_MCP_OAUTH_TOKEN / NOTION_MCP_TOKEN).")
-
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Notion-Version": os.getenv("NOTION_API_VERSION", "2022-06-28"),
-            "Content-Type": "application/json",
-        }
+    @model_validator(mode="before")
+    @classmethod
+    def _forward_json_aliases(cls, values):
+        if not isinstance(values, dict):
+            return values
+        values = dict(values)
+        for raw_key, key in (("properties_json", "properties"), ("batch_payload_json", "batch_payload")):
+            raw = values.get(raw_key)
+            if raw and values.get(key) is None:
+                try:
+                    values[key] = json.loads(raw)
+                except json.JSONDecodeError as exc:
+                    raise ValueError(f"Invalid JSON in {raw_key}: {exc}") from exc
+        return values
 
+    def run(self) -> str:
         target = self.target_id or self._context.get("lead_db_id")
 
+        if self.operation in _CACHED_OPERATIONS:
+            if self.operation == "fetch_page":
+                # Paging/limit fields don't affect a single-page fetch, so keep one entry per page.
+                cache_key = (self.operation, target)
+            else:
+                cache_key = (
+                    self.operation,
+                    None if self.operation == "list_databases" else target,
+                    self.page_size,
+                    self.max_pages,
+                    self.result_limit,
+                )
+            cached = cache_get(cache_key)
+            if cached is not None:
+                return cached
+            result = self._run(target)
+            cache_set(cache_key, result)
+            return result
+
+        result = self._run(target)
+        if self.operation in _MUTATING_OPERATIONS:
+            invalidate_page_reads()
+        return result
+
+    def _run(self, target: Optional[str]) -> str:
+        session = get_session()
+
         if self.operation == "list_databases":
-            payload: dict = {"page_size": self.page_size, "filter": {"value": "database", "property": "object"}}
-            results = []
-            cursor = None
-            for _ in range(self.max_pages):
-                if cursor:
-                    payload["start_cursor"] = cursor
-                elif "start_cursor" in payload:
-                    payload.pop("start_cursor")
-                res = requests.post("https://api.notion.com/v1/search", headers=headers, json=payload, timeout=30)
-                res.raise_for_status()
-                data = res.json()
-                results.extend(data.get("results", []))
-                cursor = data.get("next_cursor")
-                if not cursor:
-                    break
-            lines = [f"{idx}. {self._extract_title(db)} ({db.get('id')})" for idx, db in enumerate(results, 1)]
-            return "Databases:\n" + ("\n".join(lines) if lines else "(none found)")
+            payload: dict = {"page_size": self.page_size, "filter": LIST_DB_FILTER}
+            results = fetch_all_pages(
+                session, "https://api.notion.com/v1/search", payload, self.max_pages, summarize, self.result_limit
+            )
+            return "Databases:\n" + format_rows(results)
 
         if not target:
             raise ValueError("target_id is required (or set context lead_db_id) for this operation.")
 
         if self.operation == "list_database_pages":
-            payload: dict = {"page_size": self.page_size}
-            pages = []
-            cursor = None
-            for _ in range(self.max_pages):
-                if cursor:
-                    payload["start_cursor"] = cursor
-                elif "start_cursor" in payload:
-                    payload.pop("start_cursor")
-                res = requests.post(
-                    f"https://api.notion.com/v1/databases/{target}/query",
-                    headers=headers,
-                    json=payload,
-                    timeout=30,
-                )
-                res.raise_for_status()
-                data = res.json()
-                pages.extend(data.get("results", []))
-                cursor = data.get("next_cursor")
-                if not cursor:
-                    break
-            lines = [f"{idx}. {self._extract_title(pg)} ({pg.get('id')})" for idx, pg in enumerate(pages, 1)]
-            return f"Database {target} pages (paginated up to {self.max_pages} pages x {self.page_size}):\n" + (
-                "\n".join(lines) if lines else "(none found)"
+            db_ids = [db_id.strip() for db_id in target.split(",") if db_id.strip()]
+            if not db_ids:
+                raise ValueError("target_id is required (or set context lead_db_id) for list_database_pages.")
+            urls = [f"https://api.notion.com/v1/databases/{db_id}/query" for db_id in db_ids]
+            page_lists = fetch_all_pages_many(
+                session, urls, {"page_size": self.page_size}, self.max_pages, summarize, self.result_limit
+            )
+            return "\n\n".join(
+                f"Database {db_id} pages (paginated up to {self.max_pages} pages x {self.page_size}):\n"
+                + format_rows(pages)
+                for db_id, pages in zip(db_ids, page_lists)
             )
 
         if self.operation == "query_database":
-            payload: dict = {"page_size": self.page_size}
-            res = requests.post(
+            limit = self.result_limit if self.result_limit is not None else 10
+            payload: dict = {"page_size": min(self.page_size, limit)}
+            res = session.post(
                 f"https://api.notion.com/v1/databases/{target}/query",
-                headers=headers,
                 json=payload,
                 timeout=30,
             )
             res.raise_for_status()
-            rows = res.json().get("results", [])
-            body = "\n".join(f"- {self._extract_title(r)} ({r.get('id')})" for r in rows[:10])
-            return f"Queried database {target}: {len(rows)} results (showing up to 10):\n{body}"
+            data = res.json()
+            rows = data.get("results", [])[:limit]
+            more = ", more available" if data.get("has_more") else ""
+            body = "\n".join(f"- {title} ({row_id})" for title, row_id in map(summarize, rows))
+            return f"Queried database {target}: {len(rows)} results (showing up to {limit}{more}):\n{body}"
 
         if self.operation == "fetch_page":
-            res = requests.get(f"https://api.notion.com/v1/pages/{target}", headers=headers, timeout=30)
+            res = session.get(f"https://api.notion.com/v1/pages/{target}", timeout=30)
             res.raise_for_status()
             data = res.json()
-            return f"Fetched page {target} titled '{self._extract_title(data)}'."
+            return f"Fetched page {target} titled '{extract_title(data)}'."
 
         if self.operation == "create_page":
-            if not self.properties_json:
-                raise ValueError("properties_json is required for create_page.")
-            properties = self._parse_json(self.properties_json, "properties_json")
-            payload: dict = {"parent": {"database_id": target}, "properties": properties}
-            res = requests.post("https://api.notion.com/v1/pages", headers=headers, json=payload, timeout=30)
+            if not self.properties:
+                raise ValueError("properties is required for create_page.")
+            payload: dict = {"parent": {"database_id": target}, "properties": self.properties}
+            res = get_write_session().post("https://api.notion.com/v1/pages", json=payload, timeout=30)
             res.raise_for_status()
             created = res.json()
             return f"Created page in database {target} with id {created.get('id')}."
 
+        if self.operation == "create_pages_bulk":
+            if not self.batch_payload:
+                raise ValueError("batch_payload is required for create_pages_bulk.")
+            results = create_pages_bulk(get_write_session(), target, self.batch_payload)
+            created_count = sum(1 for r in results if "id" in r)
+            return f"Created {created_count}/{len(results)} pages in database {target}. Results: {json.dumps(results)}"
+
         if self.operation == "update_page":
-            if not self.properties_json:
-                raise ValueError("properties_json is required for update_page.")
-            properties = self._parse_json(self.properties_json, "properties_json")
-            res = requests.patch(
+            if not self.properties:
+                raise ValueError("properties is required for update_page.")
+            res = session.patch(
                 f"https://api.notion.com/v1/pages/{target}",
-                headers=headers,
-                json={"properties": properties},
+                json={"properties": self.properties},
                 timeout=30,
             )
             res.raise_for_status()
             return f"Updated page {target} properties."
 
         raise ValueError(f"Unsupported operation: {self.operation}")
-
-    def _parse_json(self, raw: str, label: str):
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid JSON in {label}: {exc}") from exc
-
-    @staticmethod
-    def _extract_title(page_data: dict) -> str:
-        props = page_data.get("properties", {})
-        for prop in props.values():
-            if isinstance(prop, dict) and prop.get("type") == "title":
-                title_items = prop.get("title", [])
-                if title_items:
-                    return title_items[0].get("plain_text", "").strip() or "(untitled)"
-        return "(untitled)"
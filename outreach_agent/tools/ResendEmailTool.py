@@ -1,25 +1,79 @@
 import json
 import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Literal, Optional
 
-import resend
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from agency_swarm.tools import BaseTool
-from pydantic import Field, validator
-from dotenv import load_dotenv
+from pydantic import Field, field_validator, model_validator
 
-load_dotenv()
+
+# Max in-flight requests for send_many.
+_SEND_MANY_CONCURRENCY = 10
+
+# Backoff for send_many's direct HTTP posts; each carries an Idempotency-Key, so a retried send is delivered once.
+# Every other operation goes through the resend SDK and is not retried.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+_SESSION: Optional[requests.Session] = None
+_resend = None
+
+
+def _get_resend(api_key: str):
+    """Import the resend SDK on first use (send_many and non-email agents never load it) and set the API key."""
+    global _resend
+    if _resend is None:
+        import resend
+
+        _resend = resend
+    _resend.api_key = api_key
+    return _resend
+
+
+def _get_session(api_key: str) -> requests.Session:
+    """Return the shared Resend HTTP session, creating it (with pooled connections) on first use."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_SEND_MANY_CONCURRENCY, max_retries=_RETRY)
+        session.mount("https://api.resend.com", adapter)
+        session.headers.update({"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"})
+        _SESSION = session
+    return _SESSION
+
+
+def _send_one(session: requests.Session, params: dict) -> dict:
+    # The idempotency key is fixed per email, so a retried POST can never deliver the same message twice.
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+    try:
+        res = session.post("https://api.resend.com/emails", json=params, headers=headers, timeout=30)
+        res.raise_for_status()
+        return {"to": params.get("to"), "id": res.json().get("id")}
+    except requests.RequestException as exc:
+        return {"to": params.get("to"), "error": str(exc)}
 
 
 class ResendEmailTool(BaseTool):
     """
-    Send and manage emails via Resend. Supports single send, batch send, retrieval, update (e.g., scheduled_at),
-    cancel, list, and attachment operations.
+    Send and manage emails via Resend. Supports single send, batch send, concurrent multi-send, retrieval,
+    update (e.g., scheduled_at), cancel, list, and attachment operations.
     """
 
     operation: Literal[
         "send_email",
         "send_batch",
+        "send_many",
         "get_email",
         "update_email",
         "cancel_email",
@@ -36,16 +90,36 @@ class ResendEmailTool(BaseTool):
     text: Optional[str] = Field(None, description="Plain text body for send (optional).")
     scheduled_at: Optional[str] = Field(None, description="ISO timestamp for scheduling/rescheduling.")
 
-    # Batch payload provided as JSON string list of email param dicts
-    batch_payload_json: Optional[str] = Field(
+    # Batch payload as a list of email param dicts
+    batch_payload: Optional[list[dict]] = Field(
         None,
-        description="JSON list of email param dicts for batch send. Each item should include from, to, subject, and html/text.",
+        description=(
+            "List of email param dicts for send_batch/send_many. Each item should include from, to, subject, "
+            "and html/text."
+        ),
     )
+    # Backward-compatible JSON-string form of batch_payload; parsed into it during validation.
+    batch_payload_json: Optional[str] = Field(None, description="Deprecated: JSON string form of batch_payload.")
 
     email_id: Optional[str] = Field(None, description="Email id for get/update/cancel/list_attachments/get_attachment.")
     attachment_id: Optional[str] = Field(None, description="Attachment id for get_attachment.")
 
-    @validator("scheduled_at")
+    @model_validator(mode="before")
+    @classmethod
+    def _forward_batch_payload_json(cls, values):
+        if not isinstance(values, dict):
+            return values
+        values = dict(values)
+        raw = values.get("batch_payload_json")
+        if raw and values.get("batch_payload") is None:
+            try:
+                values["batch_payload"] = json.loads(raw)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid JSON in batch_payload_json: {exc}") from exc
+        return values
+
+    @field_validator("scheduled_at")
+    @classmethod
     def _validate_iso_datetime(cls, v):
         if v is None:
             return v
@@ -59,81 +133,102 @@ class ResendEmailTool(BaseTool):
         api_key = os.getenv("RESEND_API_KEY")
         if not api_key:
             raise ValueError("Missing RESEND_API_KEY in environment.")
-        resend.api_key = api_key
-
-        if self.operation == "send_email":
-            if not (self.from_email and self.to and self.subject and (self.html or self.text)):
-                raise ValueError("from_email, to, subject, and html or text are required for send_email.")
-            params = {
-                "from": self.from_email,
-                "to": self.to,
-                "subject": self.subject,
-                "html": self.html,
-            }
-            if self.text:
-                params["text"] = self.text
-            if self.scheduled_at:
-                params["scheduled_at"] = self.scheduled_at
-            email = resend.Emails.send(params)
-            return f"Sent email id: {email['id']} to {', '.join(self.to)}."
-
-        if self.operation == "send_batch":
-            if not self.batch_payload_json:
-                raise ValueError("batch_payload_json is required for send_batch.")
-            payload = self._parse_batch(self.batch_payload_json)
-            emails = resend.Batch.send(payload)
-            return f"Batch send triggered for {len(payload)} messages. Response: {emails}"
-
-        if self.operation == "get_email":
-            if not self.email_id:
-                raise ValueError("email_id is required for get_email.")
-            email = resend.Emails.get(email_id=self.email_id)
-            return f"Email {self.email_id} status: {email.get('status')}"
-
-        if self.operation == "update_email":
-            if not (self.email_id and self.scheduled_at):
-                raise ValueError("email_id and scheduled_at are required for update_email.")
-            update_params = {"id": self.email_id, "scheduled_at": self.scheduled_at}
-            result = resend.Emails.update(params=update_params)
-            return f"Updated email {self.email_id} schedule to {self.scheduled_at}. Response: {result}"
-
-        if self.operation == "cancel_email":
-            if not self.email_id:
-                raise ValueError("email_id is required for cancel_email.")
-            result = resend.Emails.cancel(email_id=self.email_id)
-            return f"Canceled email {self.email_id}. Response: {result}"
-
-        if self.operation == "list_emails":
-            emails = resend.Emails.list()
-            count = len(emails.get("data", [])) if isinstance(emails, dict) else len(emails or [])
-            return f"Listed {count} emails."
-
-        if self.operation == "list_attachments":
-            if not self.email_id:
-                raise ValueError("email_id is required for list_attachments.")
-            attachments = resend.Emails.Attachments.list(email_id=self.email_id)
-            count = len(attachments.get("data", [])) if isinstance(attachments, dict) else len(attachments or [])
-            return f"Email {self.email_id} attachments: {count} found."
-
-        if self.operation == "get_attachment":
-            if not (self.email_id and self.attachment_id):
-                raise ValueError("email_id and attachment_id are required for get_attachment.")
-            attachment = resend.Emails.Attachments.get(email_id=self.email_id, attachment_id=self.attachment_id)
-            return f"Fetched attachment {self.attachment_id} for email {self.email_id}. Size: {len(attachment or {})} bytes."
-
-        raise ValueError(f"Unsupported operation: {self.operation}")
-
-    def _parse_batch(self, raw: str):
-        try:
-            payload = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid JSON in batch_payload_json: {exc}") from exc
-        if not isinstance(payload, list):
-            raise ValueError("batch_payload_json must be a JSON list of email param dictionaries.")
-        return payload
+
+        handler = _OPS.get(self.operation)
+        if handler is None:
+            raise ValueError(f"Unsupported operation: {self.operation}")
+        return handler(self, api_key)
+
+    def _op_send_email(self, api_key: str) -> str:
+        if not (self.from_email and self.to and self.subject and (self.html or self.text)):
+            raise ValueError("from_email, to, subject, and html or text are required for send_email.")
+        params = {
+            "from": self.from_email,
+            "to": self.to,
+            "subject": self.subject,
+            "html": self.html,
+        }
+        if self.text:
+            params["text"] = self.text
+        if self.scheduled_at:
+            params["scheduled_at"] = self.scheduled_at
+        email = _get_resend(api_key).Emails.send(params)
+        return f"Sent email id: {email['id']} to {', '.join(self.to)}."
+
+    def _op_send_batch(self, api_key: str) -> str:
+        if not self.batch_payload:
+            raise ValueError("batch_payload is required for send_batch.")
+        payload = self.batch_payload
+        emails = _get_resend(api_key).Batch.send(payload)
+        return f"Batch send triggered for {len(payload)} messages. Response: {emails}"
+
+    def _op_send_many(self, api_key: str) -> str:
+        if not self.batch_payload:
+            raise ValueError("batch_payload is required for send_many.")
+        payload = self.batch_payload
+        session = _get_session(api_key)
+        with ThreadPoolExecutor(max_workers=max(1, min(_SEND_MANY_CONCURRENCY, len(payload)))) as pool:
+            results = list(pool.map(lambda params: _send_one(session, params), payload))
+        sent = sum(1 for r in results if "id" in r)
+        return f"Sent {sent}/{len(payload)} emails individually. Results: {json.dumps(results)}"
+
+    def _op_get_email(self, api_key: str) -> str:
+        if not self.email_id:
+            raise ValueError("email_id is required for get_email.")
+        email = _get_resend(api_key).Emails.get(email_id=self.email_id)
+        return f"Email {self.email_id} status: {email.get('status')}"
+
+    def _op_update_email(self, api_key: str) -> str:
+        if not (self.email_id and self.scheduled_at):
+            raise ValueError("email_id and scheduled_at are required for update_email.")
+        update_params = {"id": self.email_id, "scheduled_at": self.scheduled_at}
+        result = _get_resend(api_key).Emails.update(params=update_params)
+        return f"Updated email {self.email_id} schedule to {self.scheduled_at}. Response: {result}"
+
+    def _op_cancel_email(self, api_key: str) -> str:
+        if not self.email_id:
+            raise ValueError("email_id is required for cancel_email.")
+        result = _get_resend(api_key).Emails.cancel(email_id=self.email_id)
+        return f"Canceled email {self.email_id}. Response: {result}"
+
+    def _op_list_emails(self, api_key: str) -> str:
+        emails = _get_resend(api_key).Emails.list()
+        count = len(emails.get("data", [])) if isinstance(emails, dict) else len(emails or [])
+        return f"Listed {count} emails."
+
+    def _op_list_attachments(self, api_key: str) -> str:
+        if not self.email_id:
+            raise ValueError("email_id is required for list_attachments.")
+        attachments = _get_resend(api_key).Emails.Attachments.list(email_id=self.email_id)
+        count = len(attachments.get("data", [])) if isinstance(attachments, dict) else len(attachments or [])
+        return f"Email {self.email_id} attachments: {count} found."
+
+    def _op_get_attachment(self, api_key: str) -> str:
+        if not (self.email_id and self.attachment_id):
+            raise ValueError("email_id and attachment_id are required for get_attachment.")
+        attachment = _get_resend(api_key).Emails.Attachments.get(email_id=self.email_id, attachment_id=self.attachment_id)
+        return f"Fetched attachment {self.attachment_id} for email {self.email_id}. Size: {len(attachment or {})} bytes."
+
+
+# Operation name -> ResendEmailTool handler method; each takes the Resend API key.
+_OPS = {
+    "send_email": ResendEmailTool._op_send_email,
+    "send_batch": ResendEmailTool._op_send_batch,
+    "send_many": ResendEmailTool._op_send_many,
+    "get_email": ResendEmailTool._op_get_email,
+    "update_email": ResendEmailTool._op_update_email,
+    "cancel_email": ResendEmailTool._op_cancel_email,
+    "list_emails": ResendEmailTool._op_list_emails,
+    "list_attachments": ResendEmailTool._op_list_attachments,
+    "get_attachment": ResendEmailTool._op_get_attachment,
+}
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     # Simple sanity check (won't send without valid API key/addresses)
     tool = ResendEmailTool(operation="list_emails")
     try: